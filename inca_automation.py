@@ -17,28 +17,52 @@ python inca_refactored.py -c calib.xlsx -m "Input_1,Input_2,Output" -d 10 -i 0.2
 필수 요구사항:
 - Python 3.7 이상
 - pip install pywin32 openpyxl
+- (선택) pip install python-calamine  # 대용량 Excel 고속 읽기
 
 작성자: INCA Automation Team
 버전: 2.0
 날짜: 2025-10-22
 """
 
-import win32com.client
 import time
 import sys
 import os
+import traceback
 import argparse
-from datetime import datetime
+import collections
+import functools
+import math
+from datetime import datetime, timedelta
 import csv
-from typing import Dict, List, Optional, Tuple
+import glob
+import json
+import posixpath
+import re
+import queue
+import threading
+import zipfile
+import xml.etree.ElementTree as ET
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
-# Excel 파일 읽기를 위한 라이브러리
-try:
-    import openpyxl
-except ImportError:
-    print("✗ 오류: openpyxl이 설치되지 않았습니다.")
-    print("  해결 방법: pip install openpyxl")
-    sys.exit(1)
+# xlsx(OOXML) 워크시트 XML 네임스페이스
+XLSX_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+XLSX_REL_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+
+# 날짜/시간을 나타내는 xlsx 기본 숫자 서식 번호 (openpyxl과 동일)
+XLSX_BUILTIN_DATE_FORMATS = frozenset({'14', '15', '16', '17', '18', '19', '20', '21', '22',
+                                       '45', '46', '47'})
+
+# 사용자 숫자 서식에서 날짜 판별 전에 제거할 부분 (따옴표 문자열, 이스케이프 문자, [색상] 등)
+_NUM_FMT_LITERAL_RE = re.compile(r'"[^"]*"|\\.|\[[^\]]*\]')
+
+# 콤마로 구분된 변수명 하나 (앞뒤 공백 제외, 이름 안의 공백은 유지)
+_VAR_NAME_RE = re.compile(r'[^,\s](?:[^,]*[^,\s])?')
+
+# 측정값 읽기 실패를 나타내는 값 (출력 시 'N/A'로 표시)
+NAN = float('nan')
+
+# 이미 상세 정보(traceback)를 출력한 오류 (유형, 메시지)
+_reported_errors: Set[Tuple[str, str]] = set()
 
 
 # ============================================================================
@@ -53,9 +77,8 @@ def print_section_header(title: str, char: str = '=') -> None:
     @param char: 구분선 문자 (기본값: '=')
     @return: None
     """
-    print(f"\n{char * 80}")
-    print(title)
-    print(char * 80)
+    line = char * 80
+    sys.stdout.write(f"\n{line}\n{title}\n{line}\n")
 
 
 def print_error(message: str, solutions: List[str] = None) -> None:
@@ -66,11 +89,11 @@ def print_error(message: str, solutions: List[str] = None) -> None:
     @param solutions: 해결 방법 리스트
     @return: None
     """
-    print(f"\n✗ 오류: {message}")
+    lines = [f"\n✗ 오류: {message}"]
     if solutions:
-        print("\n해결 방법:")
-        for idx, solution in enumerate(solutions, 1):
-            print(f"  {idx}. {solution}")
+        lines.append("\n해결 방법:")
+        lines.extend(f"  {idx}. {solution}" for idx, solution in enumerate(solutions, 1))
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_success(message: str) -> None:
@@ -93,6 +116,25 @@ def print_warning(message: str) -> None:
     print(f"⚠ {message}")
 
 
+def print_traceback_once(error: Exception) -> None:
+    """
+    현재 처리 중인 예외의 상세 정보를 출력합니다.
+    
+    같은 유형/메시지의 오류는 처음 한 번만 전체 traceback을 출력하고,
+    이후에는 한 줄 안내로 대신합니다.
+    
+    @param error: 처리 중인 예외
+    @return: None
+    """
+    key = (type(error).__name__, str(error))
+    if key in _reported_errors:
+        print("  (동일한 오류가 반복되어 상세 정보를 생략합니다)")
+        return
+    
+    _reported_errors.add(key)
+    traceback.print_exc()
+
+
 # ============================================================================
 # 파일 검증 유틸리티
 # ============================================================================
@@ -142,58 +184,121 @@ class FileValidator:
         return True
     
     @staticmethod
-    def is_file_writable(filename: str) -> bool:
+    def validate_output_directory(filename: str) -> bool:
         """
-        파일이 쓰기 가능한지 확인합니다.
+        출력 파일을 만들 폴더에 쓰기 권한이 있는지 확인합니다.
+        
+        파일은 만들지 않습니다 (실제 선점은 측정을 시작할 때 수행).
         
-        @param filename: 확인할 파일명
+        @param filename: 출력 파일명
         @return: 쓰기 가능하면 True, 아니면 False
         """
-        if not os.path.exists(filename):
-            try:
-                directory = os.path.dirname(filename)
-                if directory and not os.path.exists(directory):
-                    return False
-                
-                with open(filename, 'w') as f:
-                    pass
-                os.remove(filename)
-                return True
-            except:
-                return False
+        directory = os.path.dirname(filename) or '.'
+        if not (os.path.isdir(directory) and os.access(directory, os.W_OK)):
+            print_error(
+                "출력 폴더에 파일을 만들 수 없습니다!",
+                [
+                    f"출력 폴더가 존재하는지 확인하세요: {os.path.abspath(directory)}",
+                    "출력 폴더의 쓰기 권한을 확인하세요"
+                ]
+            )
+            return False
+        print_success("출력 폴더 쓰기 권한 확인 완료")
+        return True
+    
+    @staticmethod
+    def reserve_file(filename: str) -> bool:
+        """
+        파일을 O_CREAT | O_EXCL로 원자적으로 생성하여 선점합니다.
+        
+        이미 있는 파일은 (다른 프로세스가 방금 만든 경우를 포함해) 선점에
+        실패하므로 두 프로세스가 같은 이름을 차지할 수 없습니다.
         
+        @param filename: 선점할 파일명
+        @return: 새로 생성했으면 True, 이미 있으면 False
+        @raises: OSError if 파일을 생성할 수 없는 경우 (권한, 경로 오류 등)
+        """
         try:
-            with open(filename, 'a'):
-                pass
-            return True
-        except:
+            fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
             return False
+        
+        os.close(fd)
+        return True
     
     @staticmethod
-    def get_available_filename(filename: str) -> Optional[str]:
+    def reserve_output_file(filename: str, part_suffix: str) -> bool:
         """
-        사용 가능한 파일명을 생성합니다 (충돌 시 _1, _2 등 추가).
+        출력 파일과 측정 중 실제로 기록할 임시 파일(filename + part_suffix)을
+        함께 선점합니다. 임시 파일을 선점하지 못하면 출력 파일 선점도 해제합니다.
         
-        @param filename: 원본 파일명
-        @return: 사용 가능한 파일명 또는 None
+        @param filename: 출력 파일명
+        @param part_suffix: 임시 파일 접미사
+        @return: 둘 다 선점했으면 True, 하나라도 이미 있으면 False
+        @raises: OSError if 파일을 생성할 수 없는 경우
         """
-        print(f"\n출력 파일 확인 중: {filename}")
+        if not FileValidator.reserve_file(filename):
+            return False
         
-        if FileValidator.is_file_writable(filename):
-            print_success("출력 파일 사용 가능")
-            return filename
+        try:
+            if FileValidator.reserve_file(filename + part_suffix):
+                return True
+        except OSError:
+            os.remove(filename)
+            raise
         
-        print_warning("원본 파일을 사용할 수 없습니다 (열려있거나 권한 없음)")
-        print("  대체 파일명 검색 중...")
+        os.remove(filename)
+        return False
+    
+    @staticmethod
+    def release_output_file(filename: str, part_suffix: str) -> None:
+        """
+        reserve_output_file로 선점한 출력 파일과 임시 파일을 삭제합니다.
         
+        @param filename: 출력 파일명
+        @param part_suffix: 임시 파일 접미사
+        """
+        for path in (filename + part_suffix, filename):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    
+    @staticmethod
+    def get_available_filename(filename: str, part_suffix: str) -> Optional[str]:
+        """
+        사용 가능한 출력 파일명을 선점합니다 (이미 있으면 _1, _2 등 추가).
+        
+        @param filename: 원본 파일명
+        @param part_suffix: 측정 중 기록할 임시 파일 접미사
+        @return: 선점한 파일명 또는 None
+        """
+        print(f"\n출력 파일 확인 중: {filename}")
         base_name, ext = os.path.splitext(filename)
         
-        for counter in range(1, 101):
-            new_filename = f"{base_name}_{counter}{ext}"
-            if FileValidator.is_file_writable(new_filename):
-                print(f"\n✓ 대체 파일명 사용: {new_filename}")
-                print("  이유: 원본 파일이 다른 프로그램에서 사용 중")
-                return new_filename
+        try:
+            if FileValidator.reserve_output_file(filename, part_suffix):
+                print_success("출력 파일 사용 가능")
+                return filename
+            
+            print_warning("원본 파일이 이미 존재합니다 (덮어쓰지 않음)")
+            print("  대체 파일명 검색 중...")
+            
+            for counter in range(1, 101):
+                new_filename = f"{base_name}_{counter}{ext}"
+                if FileValidator.reserve_output_file(new_filename, part_suffix):
+                    print(f"\n✓ 대체 파일명 사용: {new_filename}")
+                    print("  이유: 같은 이름의 파일이 이미 존재")
+                    return new_filename
+        except OSError as e:
+            print_error(
+                "출력 파일을 생성할 수 없습니다!",
+                [
+                    "출력 폴더가 존재하고 쓰기 권한이 있는지 확인하세요",
+                    f"오류 내용: {e}"
+                ]
+            )
+            return None
         
         print_error(
             "사용 가능한 파일명을 찾을 수 없습니다!",
@@ -212,12 +317,16 @@ class FileValidator:
 class ExcelCalibrationLoader:
     """Excel 파일에서 캘리브레이션 데이터를 로드하는 클래스"""
     
+    # 파싱 결과 캐시 형식 버전 (파싱 규칙이 바뀌면 올려서 이전 캐시를 무효화)
+    CACHE_VERSION = 2
+    
     @staticmethod
-    def load(excel_path: str) -> Optional[Dict[str, float]]:
+    def load(excel_path: str, verbose: bool = False) -> Optional[Dict[str, float]]:
         """
         Excel 파일에서 캘리브레이션 변수와 값을 읽습니다.
         
         @param excel_path: Excel 파일 경로
+        @param verbose: 읽은 변수를 한 줄씩 출력할지 여부
         @return: {변수명: 값} 딕셔너리 또는 None (실패 시)
         """
         print_section_header("Excel 파일 로드")
@@ -229,8 +338,24 @@ class ExcelCalibrationLoader:
         if not FileValidator.validate_file_readable(excel_path):
             return None
         
+        # 변수를 한 줄씩 보여 주는 verbose 모드에서는 항상 다시 파싱
+        cache_path = ExcelCalibrationLoader._cache_path(excel_path)
+        cached = None if verbose else ExcelCalibrationLoader._load_cache(cache_path)
+        if cached:
+            calib_data, warnings = cached
+            print_success(f"변경되지 않은 파일 - 캐시 사용 ({len(calib_data)}개 변수)")
+            if warnings:
+                sys.stdout.write("\n".join(warnings) + "\n")
+            ExcelCalibrationLoader._print_load_summary(len(calib_data), len(warnings))
+            return calib_data
+        
         try:
-            return ExcelCalibrationLoader._parse_excel(excel_path)
+            calib_data, warnings = ExcelCalibrationLoader._parse_excel(excel_path, verbose)
+            ExcelCalibrationLoader._save_cache(excel_path, cache_path, calib_data, warnings)
+            return calib_data
+        except ImportError:
+            ExcelCalibrationLoader._handle_import_error()
+            return None
         except PermissionError:
             ExcelCalibrationLoader._handle_permission_error(excel_path)
             return None
@@ -239,72 +364,407 @@ class ExcelCalibrationLoader:
             return None
     
     @staticmethod
-    def _parse_excel(excel_path: str) -> Dict[str, float]:
+    def _cache_path(excel_path: str) -> str:
+        """
+        파싱 결과 캐시 파일 경로를 만듭니다 (수정 시각과 크기를 키로 사용).
+        
+        @param excel_path: Excel 파일 경로
+        @return: 캐시 파일 경로
+        """
+        st = os.stat(excel_path)
+        return f"{excel_path}.{st.st_mtime_ns}.{st.st_size}.json"
+    
+    @staticmethod
+    def _load_cache(cache_path: str) -> Optional[Tuple[Dict[str, float], List[str]]]:
+        """
+        캐시된 파싱 결과를 읽습니다.
+        
+        캐시는 성능을 위한 것이므로 어떤 이유로든 읽을 수 없으면
+        None을 반환하여 Excel 파일을 다시 파싱하도록 합니다.
+        
+        @param cache_path: 캐시 파일 경로
+        @return: ({변수명: 값} 딕셔너리, 건너뛴 행 경고 리스트) 또는 None (캐시 없음/손상 시)
+        """
+        if not os.path.exists(cache_path):
+            return None
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get('version') != ExcelCalibrationLoader.CACHE_VERSION:
+                return None
+            calib_data = {str(name): float(value) for name, value in cached['data'].items()}
+            return calib_data, [str(line) for line in cached['warnings']]
+        except Exception:
+            return None
+    
+    @staticmethod
+    def _save_cache(excel_path: str, cache_path: str, calib_data: Dict[str, float],
+                    warnings: List[str]) -> None:
+        """
+        파싱 결과를 캐시에 저장하고 이전 캐시 파일을 정리합니다.
+        
+        임시 파일에 쓴 뒤 os.replace로 교체하므로 중간에 실패해도 손상된
+        캐시가 남지 않습니다. 캐시 저장 실패는 무시합니다.
+        
+        @param excel_path: Excel 파일 경로
+        @param cache_path: 캐시 파일 경로
+        @param calib_data: {변수명: 값} 딕셔너리
+        @param warnings: 건너뛴 행의 경고 메시지 (캐시 사용 시 다시 출력)
+        """
+        tmp_path = f"{cache_path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': ExcelCalibrationLoader.CACHE_VERSION,
+                           'data': calib_data, 'warnings': warnings}, f, ensure_ascii=False)
+            os.replace(tmp_path, cache_path)
+        except (OSError, ValueError):
+            return
+        
+        # <xlsx>.<수정 시각>.<크기>.json 형식의 이전 캐시만 삭제 (다른 JSON 파일은 유지)
+        cache_name_re = re.compile(re.escape(os.path.basename(excel_path)) + r'\.\d+\.\d+\.json')
+        for old_path in glob.glob(f"{glob.escape(excel_path)}.*.json"):
+            if old_path != cache_path and cache_name_re.fullmatch(os.path.basename(old_path)):
+                try:
+                    os.remove(old_path)
+                except OSError:
+                    pass
+    
+    @staticmethod
+    def _parse_excel(excel_path: str,
+                     verbose: bool = False) -> Tuple[Dict[str, float], List[str]]:
         """
         Excel 파일을 파싱합니다.
         
+        행별 메시지는 모아 두었다가 파싱이 끝난 뒤 한 번에 출력합니다.
+        
         @param excel_path: Excel 파일 경로
-        @return: {변수명: 값} 딕셔너리
+        @param verbose: 읽은 변수를 한 줄씩 출력할지 여부
+        @return: ({변수명: 값} 딕셔너리, 건너뛴 행 경고 리스트)
         @raises: Exception if parsing fails
         """
         print("\nExcel 데이터 파싱 중...")
         
-        wb = openpyxl.load_workbook(excel_path)
-        ws = wb.active
-        
         calib_data = {}
+        warnings = []
+        log_lines = []
         row_count = 0
         skip_count = 0
         
-        for row_idx, row in enumerate(ws.iter_rows(min_row=2, values_only=True), start=2):
-            if row[0] is None:
-                break
-            
-            result = ExcelCalibrationLoader._parse_row(row, row_idx)
-            if result:
-                var_name, var_value = result
-                calib_data[var_name] = var_value
-                row_count += 1
-                print(f"  ✓ {var_name} = {var_value}")
-            else:
-                skip_count += 1
+        rows = ExcelCalibrationLoader._iter_rows(excel_path)
+        try:
+            for row_idx, row in enumerate(rows, start=2):
+                if not row or row[0] is None:
+                    break
+                
+                result = ExcelCalibrationLoader._parse_row(row, row_idx, warnings)
+                if result:
+                    var_name, var_value = result
+                    calib_data[var_name] = var_value
+                    row_count += 1
+                    if verbose:
+                        log_lines.append(f"  ✓ {var_name} = {var_value}")
+                else:
+                    # _parse_row는 건너뛰는 행마다 경고 한 줄을 추가함
+                    skip_count += 1
+                    log_lines.append(warnings[-1])
+        finally:
+            rows.close()
+        
+        if log_lines:
+            sys.stdout.write("\n".join(log_lines) + "\n")
         
         if row_count == 0:
             ExcelCalibrationLoader._handle_empty_data()
             raise ValueError("No valid calibration data found")
         
-        print(f"\n{'=' * 80}")
-        print(f"✓ Excel 로드 완료: {row_count}개 변수, {skip_count}개 건너뜀")
-        print(f"{'=' * 80}")
+        ExcelCalibrationLoader._print_load_summary(row_count, skip_count)
+        return calib_data, warnings
+    
+    @staticmethod
+    def _print_load_summary(row_count: int, skip_count: int) -> None:
+        """로드 결과 요약을 출력합니다."""
+        line = '=' * 80
+        sys.stdout.write(f"\n{line}\n✓ Excel 로드 완료: {row_count}개 변수, {skip_count}개 건너뜀\n{line}\n")
+    
+    @staticmethod
+    def _iter_rows(excel_path: str) -> Iterator[Tuple]:
+        """
+        헤더를 제외한 Excel 행을 순서대로 읽습니다.
         
-        return calib_data
+        python-calamine이 설치되어 있으면 이를 사용하고, 없으면 xlsx(zip)
+        내부의 워크시트 XML을 직접 스트리밍합니다. xlsx 구조로 읽을 수 없는
+        파일만 openpyxl read_only 모드로 읽습니다. 어느 방법이든 활성 시트를
+        읽으므로 설치된 패키지에 따라 적용되는 데이터가 달라지지 않습니다.
+        
+        @param excel_path: Excel 파일 경로
+        @return: 행 값 튜플 이터레이터 (빈 셀은 None)
+        @raises: ImportError if openpyxl is needed but not installed
+        """
+        try:
+            import python_calamine
+        except ImportError:
+            python_calamine = None
+        
+        if python_calamine is not None:
+            workbook = python_calamine.CalamineWorkbook.from_path(excel_path)
+            sheet_name = ExcelCalibrationLoader._active_sheet_name(excel_path)
+            if sheet_name is None:
+                sheet = workbook.get_sheet_by_index(0)
+            else:
+                sheet = workbook.get_sheet_by_name(sheet_name)
+            for row in sheet.to_python(skip_empty_area=False)[1:]:
+                yield tuple(None if cell == "" else cell for cell in row)
+            return
+        
+        try:
+            zf, sheet_path, decode_cell = ExcelCalibrationLoader._open_xlsx(excel_path)
+        except (zipfile.BadZipFile, KeyError, ET.ParseError):
+            zf = None
+        
+        if zf is not None:
+            yield from ExcelCalibrationLoader._stream_xlsx_rows(zf, sheet_path, decode_cell)
+            return
+        
+        import openpyxl
+        wb = openpyxl.load_workbook(
+            excel_path, read_only=True, data_only=True, keep_links=False
+        )
+        try:
+            yield from wb.active.iter_rows(min_row=2, max_col=2, values_only=True)
+        finally:
+            wb.close()
     
     @staticmethod
-    def _parse_row(row: Tuple, row_idx: int) -> Optional[Tuple[str, float]]:
+    def _open_xlsx(excel_path: str) -> Tuple[zipfile.ZipFile, str, Callable[[ET.Element], Any]]:
+        """
+        xlsx 파일을 열고 활성 시트 경로와 셀 값 해석 함수를 준비합니다.
+        
+        @param excel_path: Excel 파일 경로
+        @return: (zip 파일, 활성 시트 XML 경로, 셀 값 해석 함수) 튜플
+        @raises: zipfile.BadZipFile, KeyError, ET.ParseError if not a valid xlsx
+        """
+        zf = zipfile.ZipFile(excel_path)
+        try:
+            workbook = ET.fromstring(zf.read('xl/workbook.xml'))
+            rels = ET.fromstring(zf.read('xl/_rels/workbook.xml.rels'))
+            
+            sheet = ExcelCalibrationLoader._find_active_sheet(workbook)
+            rel_id = sheet.get(f'{XLSX_REL_NS}id')
+            target = next(rel.get('Target') for rel in rels if rel.get('Id') == rel_id)
+            if target.startswith('/'):
+                sheet_path = target.lstrip('/')
+            else:
+                sheet_path = posixpath.normpath(posixpath.join('xl', target))
+            
+            pr = workbook.find(f'{XLSX_NS}workbookPr')
+            date1904 = pr is not None and pr.get('date1904') in ('1', 'true')
+            decode_cell = ExcelCalibrationLoader._make_cell_decoder(
+                ExcelCalibrationLoader._read_shared_strings(zf),
+                ExcelCalibrationLoader._read_date_styles(zf),
+                datetime(1904, 1, 1) if date1904 else datetime(1899, 12, 30)
+            )
+            return zf, sheet_path, decode_cell
+        except (IndexError, StopIteration, ValueError) as e:
+            zf.close()
+            raise KeyError(f"xlsx 구조를 해석할 수 없습니다: {e}")
+        except Exception:
+            zf.close()
+            raise
+    
+    @staticmethod
+    def _read_shared_strings(zf: zipfile.ZipFile) -> List[str]:
+        """
+        공유 문자열 테이블을 읽습니다.
+        
+        @param zf: 열린 xlsx zip 파일
+        @return: 공유 문자열 리스트 (테이블이 없으면 빈 리스트)
+        """
+        if 'xl/sharedStrings.xml' not in zf.namelist():
+            return []
+        sst = ET.fromstring(zf.read('xl/sharedStrings.xml'))
+        return [''.join(t.text or '' for t in si.iter(f'{XLSX_NS}t'))
+                for si in sst.iter(f'{XLSX_NS}si')]
+    
+    @staticmethod
+    def _read_date_styles(zf: zipfile.ZipFile) -> Set[str]:
+        """
+        날짜/시간 숫자 서식이 적용된 셀 스타일 번호를 찾습니다.
+        
+        @param zf: 열린 xlsx zip 파일
+        @return: 날짜 서식인 셀 스타일 번호(셀의 s 속성 값) 집합
+        """
+        if 'xl/styles.xml' not in zf.namelist():
+            return set()
+        styles = ET.fromstring(zf.read('xl/styles.xml'))
+        cell_xfs = styles.find(f'{XLSX_NS}cellXfs')
+        if cell_xfs is None:
+            return set()
+        
+        date_formats = set(XLSX_BUILTIN_DATE_FORMATS)
+        for num_fmt in styles.iter(f'{XLSX_NS}numFmt'):
+            code = _NUM_FMT_LITERAL_RE.sub('', num_fmt.get('formatCode', '').split(';')[0])
+            if re.search('[dmyhs]', code, re.IGNORECASE):
+                date_formats.add(num_fmt.get('numFmtId'))
+        
+        return {str(idx) for idx, xf in enumerate(cell_xfs.findall(f'{XLSX_NS}xf'))
+                if xf.get('numFmtId', '0') in date_formats}
+    
+    @staticmethod
+    def _make_cell_decoder(shared_strings: List[str], date_styles: Set[str],
+                           epoch: datetime) -> Callable[[ET.Element], Any]:
+        """
+        셀 요소를 openpyxl과 같은 Python 값으로 바꾸는 함수를 생성합니다.
+        
+        캐시된 값이 없는 수식 셀(빈 <v>)은 None, 날짜 서식 숫자 셀은 datetime이
+        되어 다른 읽기 경로와 마찬가지로 건너뛴 행으로 처리됩니다.
+        
+        @param shared_strings: 공유 문자열 리스트
+        @param date_styles: 날짜 서식 셀 스타일 번호 집합
+        @param epoch: 날짜 일련번호 0에 해당하는 시각 (1900/1904 날짜 체계)
+        @return: decode_cell(cell) 함수 - 셀 값 또는 None
+        """
+        def decode_cell(cell: ET.Element) -> Any:
+            cell_type = cell.get('t')
+            if cell_type == 'inlineStr':
+                return ''.join(t.text or '' for t in cell.iter(f'{XLSX_NS}t'))
+            
+            raw = cell.findtext(f'{XLSX_NS}v')
+            if not raw:
+                return None
+            if cell_type == 's':
+                return shared_strings[int(raw)]
+            if cell_type in ('str', 'e', 'd'):
+                return raw
+            if cell_type == 'b':
+                return raw == '1'
+            if cell.get('s') in date_styles:
+                return epoch + timedelta(days=float(raw))
+            return float(raw)
+        
+        return decode_cell
+    
+    @staticmethod
+    def _find_active_sheet(workbook: ET.Element) -> ET.Element:
+        """
+        workbook.xml에서 활성 시트(openpyxl의 wb.active와 같은 시트) 요소를 찾습니다.
+        
+        @param workbook: workbook.xml 루트 요소
+        @return: 활성 시트의 <sheet> 요소
+        @raises: IndexError, ValueError if 시트 정보를 해석할 수 없는 경우
+        """
+        view = workbook.find(f'{XLSX_NS}bookViews/{XLSX_NS}workbookView')
+        active_tab = int(view.get('activeTab', 0)) if view is not None else 0
+        return workbook.findall(f'{XLSX_NS}sheets/{XLSX_NS}sheet')[active_tab]
+    
+    @staticmethod
+    def _active_sheet_name(excel_path: str) -> Optional[str]:
+        """
+        xlsx 파일의 활성 시트 이름을 읽습니다.
+        
+        @param excel_path: Excel 파일 경로
+        @return: 활성 시트 이름 또는 None (xlsx가 아니거나 해석할 수 없는 경우)
+        """
+        try:
+            with zipfile.ZipFile(excel_path) as zf:
+                workbook = ET.fromstring(zf.read('xl/workbook.xml'))
+            return ExcelCalibrationLoader._find_active_sheet(workbook).get('name')
+        except (zipfile.BadZipFile, KeyError, ET.ParseError, IndexError, ValueError):
+            return None
+    
+    @staticmethod
+    def _stream_xlsx_rows(zf: zipfile.ZipFile, sheet_path: str,
+                          decode_cell: Callable[[ET.Element], Any]) -> Iterator[Tuple]:
+        """
+        워크시트 XML을 행 단위로 스트리밍하여 A/B열 값을 읽습니다.
+        
+        처리한 행 요소는 바로 비워 메모리 사용량을 행 수와 무관하게 유지하고,
+        XML에서 생략된 빈 행은 (None, None)으로 채워 openpyxl과 같은 순서를
+        보장합니다. 행 번호(r 속성)가 없는 행은 직전 행의 다음 행으로 보며,
+        1행(헤더)은 건너뜁니다.
+        
+        @param zf: 열린 xlsx zip 파일 (반환 시 닫힘)
+        @param sheet_path: 시트 XML 경로
+        @param decode_cell: 셀 값 해석 함수
+        @return: 2행부터의 (A열, B열) 값 튜플 이터레이터
+        """
+        row_num = 0
+        next_row = 2
+        try:
+            with zf.open(sheet_path) as sheet_xml:
+                for _, elem in ET.iterparse(sheet_xml):
+                    if elem.tag != f'{XLSX_NS}row':
+                        continue
+                    
+                    row_num = int(elem.get('r', row_num + 1))
+                    if row_num >= next_row:
+                        for _ in range(next_row, row_num):
+                            yield (None, None)
+                        yield ExcelCalibrationLoader._read_xlsx_row(elem, decode_cell)
+                        next_row = row_num + 1
+                    elem.clear()
+        finally:
+            zf.close()
+    
+    @staticmethod
+    def _read_xlsx_row(row_elem: ET.Element,
+                       decode_cell: Callable[[ET.Element], Any]) -> Tuple:
+        """
+        워크시트 XML 행 요소에서 A/B열 값을 꺼냅니다.
+        
+        @param row_elem: <row> 요소
+        @param decode_cell: 셀 값 해석 함수
+        @return: (A열, B열) 값 튜플 (빈 셀은 None)
+        """
+        values = [None, None]
+        
+        for position, cell in enumerate(row_elem.iter(f'{XLSX_NS}c')):
+            column = cell.get('r', '').rstrip('0123456789')
+            col_idx = {'A': 0, 'B': 1}.get(column, -1) if column else position
+            if 0 <= col_idx <= 1:
+                values[col_idx] = decode_cell(cell)
+        
+        return tuple(values)
+    
+    @staticmethod
+    def _parse_row(row: Tuple, row_idx: int,
+                   warnings: List[str]) -> Optional[Tuple[str, float]]:
         """
         Excel 행을 파싱합니다.
         
         @param row: Excel 행 데이터
         @param row_idx: 행 번호
+        @param warnings: 건너뛴 행의 경고 메시지를 추가할 리스트
         @return: (변수명, 값) 튜플 또는 None
         """
         var_name = str(row[0]).strip() if row[0] else ""
-        var_value = row[1]
+        var_value = row[1] if len(row) > 1 else None
         
         if not var_name:
-            print(f"  ⚠ {row_idx}행: 변수명이 비어있습니다 (건너뜀)")
+            warnings.append(f"  ⚠ {row_idx}행: 변수명이 비어있습니다 (건너뜀)")
             return None
         
         if var_value is None:
-            print(f"  ⚠ {row_idx}행 '{var_name}': 값이 비어있습니다 (건너뜀)")
+            warnings.append(f"  ⚠ {row_idx}행 '{var_name}': 값이 비어있습니다 (건너뜀)")
             return None
         
+        # 숫자 셀은 읽기 단계에서 이미 float이므로 그대로 사용하고,
+        # 정수/문자열 셀만 float() 한 번으로 변환 (실패 메시지는 모아서 출력)
+        if type(var_value) is float:
+            return (var_name, var_value)
         try:
             return (var_name, float(var_value))
         except (ValueError, TypeError):
-            print(f"  ✗ {row_idx}행 '{var_name}': 숫자 변환 실패 '{var_value}' (건너뜀)")
+            warnings.append(f"  ✗ {row_idx}행 '{var_name}': 숫자 변환 실패 '{var_value}' (건너뜀)")
             return None
     
+    @staticmethod
+    def _handle_import_error() -> None:
+        """Excel 라이브러리 미설치 오류를 처리합니다."""
+        print_error(
+            "openpyxl이 설치되지 않았습니다.",
+            ["pip install openpyxl"]
+        )
+    
     @staticmethod
     def _handle_permission_error(excel_path: str) -> None:
         """권한 오류를 처리합니다."""
@@ -327,8 +787,7 @@ class ExcelCalibrationLoader:
             ]
         )
         print(f"  오류 내용: {error}")
-        import traceback
-        traceback.print_exc()
+        print_traceback_once(error)
     
     @staticmethod
     def _handle_empty_data() -> None:
@@ -366,7 +825,7 @@ class INCADemoController:
         self.device = None
         self.device_name = None
         self.measurement_started = False
-        self.measurement_vars = {}
+        self.measurement_vars: List[str] = []
     
     def set_measurement_vars(self, var_names_str: str) -> bool:
         """
@@ -384,7 +843,8 @@ class INCADemoController:
             )
             return False
         
-        var_names = [v.strip() for v in var_names_str.split(',') if v.strip()]
+        # 변수명은 이후 딕셔너리 키로 반복 사용되므로 intern 처리 (중복은 첫 항목만 유지)
+        var_names = list(dict.fromkeys(map(sys.intern, _VAR_NAME_RE.findall(var_names_str))))
         
         if not var_names:
             print_error(
@@ -395,8 +855,7 @@ class INCADemoController:
         
         print(f"등록할 변수: {len(var_names)}개")
         for idx, var_name in enumerate(var_names, 1):
-            key = var_name.lower().replace('_', '')
-            self.measurement_vars[key] = var_name
+            self.measurement_vars.append(var_name)
             print(f"  [{idx}] {var_name}")
         
         print_success("측정 변수 설정 완료")
@@ -412,7 +871,7 @@ class INCADemoController:
         print("연결 시도 중...")
         
         try:
-            self.inca = win32com.client.Dispatch("Inca.Inca")
+            self.inca = self._dispatch_inca()
             print_success("INCA COM-API 연결 성공")
             
             self.inca.WriteToMonitor("Python 자동화 스크립트가 연결되었습니다.")
@@ -432,6 +891,32 @@ class INCADemoController:
             print(f"  오류 내용: {e}")
             return False
     
+    @staticmethod
+    def _dispatch_inca():
+        """
+        INCA COM 객체를 생성합니다.
+        
+        가능하면 gencache(makepy) 래퍼로 조기 바인딩하여 이후의 메서드 호출이
+        이름 → DISPID 조회 없이 바로 이루어지도록 합니다. 형식 라이브러리를
+        읽을 수 없거나 gen_py 캐시에 쓸 수 없는 환경에서는 기존의 지연
+        바인딩(Dispatch)으로 연결합니다.
+        
+        @return: INCA COM 객체
+        @raises: Exception if INCA COM 객체를 생성할 수 없는 경우
+        """
+        # pywin32는 INCA 연결 단계에서만 필요하므로 여기서 불러옴
+        # (--help, Excel 검증 단계가 COM 초기화를 기다리지 않도록)
+        import win32com.client
+        
+        try:
+            from win32com.client import gencache
+            inca = gencache.EnsureDispatch("Inca.Inca")
+            print("  바인딩: 조기 바인딩 (gencache)")
+            return inca
+        except Exception:
+            print("  바인딩: 지연 바인딩 (Dispatch)")
+            return win32com.client.Dispatch("Inca.Inca")
+    
     def attach_to_experiment(self) -> bool:
         """
         현재 열려 있는 Experiment에 연결합니다.
@@ -527,8 +1012,7 @@ class INCADemoController:
             ]
         )
         print(f"  오류 내용: {error}")
-        import traceback
-        traceback.print_exc()
+        print_traceback_once(error)
     
     def start_measurement(self) -> bool:
         """
@@ -595,6 +1079,12 @@ class INCADemoController:
 class CalibrationApplicator:
     """캘리브레이션 변수 적용을 담당하는 클래스"""
     
+    # 쓰기 검증 시 허용 오차
+    VERIFY_TOLERANCE = 0.01
+    
+    # 검증 읽기 전 대기 시간 (초) - 반영되는 즉시 끝나도록 짧게 시작해 점차 늘림
+    VERIFY_BACKOFF_DELAYS = (0.02, 0.05, 0.1, 0.2, 0.4)
+    
     def __init__(self, controller: INCADemoController):
         """
         초기화합니다.
@@ -602,6 +1092,9 @@ class CalibrationApplicator:
         @param controller: INCA 컨트롤러 인스턴스
         """
         self.controller = controller
+        self._calib_obj_cache: Dict[str, Any] = {}
+        self._sync_fn: Optional[Callable[[], Any]] = None
+        self._sync_name = ""
     
     def apply_all(self, calib_dict: Dict[str, float]) -> Tuple[int, int]:
         """
@@ -612,100 +1105,203 @@ class CalibrationApplicator:
         """
         print_section_header("캘리브레이션 변수 적용")
         
-        success_count = 0
-        fail_count = 0
+        success_vars, fail_vars = self._apply_batch(calib_dict)
+        
+        self._print_summary(len(success_vars), len(fail_vars), len(calib_dict))
+        return len(success_vars), len(fail_vars)
+    
+    def _apply_batch(self, calib_dict: Dict[str, float]) -> Tuple[Set[str], Set[str]]:
+        """
+        캘리브레이션 변수를 일괄 적용합니다.
+        
+        현재 값 읽기 → 전체 쓰기 → 메모리 동기화 1회 → 일괄 검증 순서로
+        진행하여 변수마다 동기화/대기하던 COM 왕복을 한 번으로 줄입니다.
+        
+        @param calib_dict: {변수명: 값} 딕셔너리
+        @return: (성공 변수 집합, 실패 변수 집합) 튜플
+        """
+        current_values = self._read_current_values(calib_dict)
+        written, fail_vars = self._write_all(calib_dict, current_values)
         
-        for idx, (var_name, new_value) in enumerate(calib_dict.items(), 1):
-            print(f"\n[{idx}/{len(calib_dict)}] {var_name}")
-            print("─" * 60)
+        if not written:
+            return set(), fail_vars
+        
+        time.sleep(0.01)
+        self._sync_memory()
+        
+        expected = {name: value for name, value in calib_dict.items() if name in written}
+        success_vars = self._verify_calibration(expected)
+        fail_vars |= written - success_vars
+        return success_vars, fail_vars
+    
+    def _read_current_values(self, calib_dict: Dict[str, float]) -> Dict[str, Optional[float]]:
+        """
+        모든 변수의 현재 값을 읽어 출력합니다.
+        
+        @param calib_dict: {변수명: 값} 딕셔너리
+        @return: {변수명: 현재 값 또는 None} 딕셔너리
+        """
+        print("현재 값 읽기 중...")
+        current_values = {}
+        
+        for idx, var_name in enumerate(calib_dict, 1):
+            current_val = self._read_calibration(var_name)
+            current_values[var_name] = current_val
             
-            if self._apply_single(var_name, new_value):
-                success_count += 1
+            if current_val is not None:
+                print(f"  [{idx}/{len(calib_dict)}] {var_name}: {current_val:.2f}")
             else:
-                fail_count += 1
+                print(f"  [{idx}/{len(calib_dict)}] {var_name}: ⚠ 현재 값을 읽을 수 없습니다")
         
-        self._print_summary(success_count, fail_count, len(calib_dict))
-        return success_count, fail_count
+        return current_values
     
-    def _apply_single(self, var_name: str, new_value: float) -> bool:
+    def _write_all(self, calib_dict: Dict[str, float],
+                   current_values: Dict[str, Optional[float]]) -> Tuple[Set[str], Set[str]]:
         """
-        단일 캘리브레이션 변수를 적용합니다.
+        모든 변수에 새 값을 연속으로 씁니다 (동기화는 호출자가 1회 수행).
         
-        @param var_name: 변수명
-        @param new_value: 새 값
-        @return: 성공 여부
-        """
-        print("  현재 값 읽기 중...")
-        current_val = self._read_calibration(var_name)
+        COM 객체의 쓰기 메서드를 먼저 모두 준비한 뒤 출력 없이 연속으로
+        호출하고, 결과는 쓰기가 끝난 후 이전 값 → 새 값으로 한 번에 출력합니다.
         
-        if current_val is not None:
-            print(f"  현재 값: {current_val:.2f}")
-        else:
-            print_warning("현재 값을 읽을 수 없습니다")
+        @param calib_dict: {변수명: 값} 딕셔너리
+        @param current_values: 쓰기 전에 읽은 {변수명: 현재 값 또는 None} 딕셔너리
+        @return: (쓰기 성공 변수 집합, 쓰기 실패 변수 집합) 튜플
+        """
+        print("\n새 값 쓰기 중...")
+        errors: Dict[str, Exception] = {}
+        setters = []
         
-        print(f"  새 값 설정: {new_value:.2f}")
-        print("  값 쓰기 시도 중...")
+        for var_name, new_value in calib_dict.items():
+            try:
+                setters.append((var_name, new_value, self._get_calib_obj(var_name).SetDoublePhysValue))
+            except Exception as e:
+                errors[var_name] = e
         
-        if not self._write_calibration(var_name, new_value):
-            return False
+        for var_name, new_value, setter in setters:
+            try:
+                setter(new_value)
+            except Exception as e:
+                errors[var_name] = e
+        
+        for var_name, new_value in calib_dict.items():
+            if var_name in errors:
+                print(f"  ✗ {var_name} 쓰기 실패: {errors[var_name]}")
+            elif current_values.get(var_name) is None:
+                print(f"  ✓ {var_name} ← {new_value:.2f}")
+            else:
+                print(f"  ✓ {var_name}: {current_values[var_name]:.2f} → {new_value:.2f}")
         
-        print_success("값 쓰기 완료")
-        return self._verify_calibration(var_name, new_value)
+        failed = set(errors)
+        return set(calib_dict) - failed, failed
     
-    def _verify_calibration(self, var_name: str, expected_value: float) -> bool:
+    def _verify_calibration(self, expected: Dict[str, float]) -> Set[str]:
         """
-        캘리브레이션 값을 검증합니다.
+        캘리브레이션 값을 일괄 검증합니다.
         
-        @param var_name: 변수명
-        @param expected_value: 예상 값
-        @return: 성공 여부
+        @param expected: {변수명: 예상 값} 딕셔너리
+        @return: 검증에 성공한 변수 집합
         """
-        print("  검증 중...")
-        time.sleep(0.3)
+        print("\n검증 중...")
         
-        for retry in range(3):
-            verify_val = self._read_calibration(var_name)
-            
-            if verify_val is not None and abs(verify_val - expected_value) < 0.01:
-                print(f"  ✓ 확인 완료: {verify_val:.2f} (변경 성공!)")
-                return True
+        pending = dict(expected)
+        verified = set()
+        last_values = {}
+        attempts = len(self.VERIFY_BACKOFF_DELAYS)
+        
+        for attempt, delay in enumerate(self.VERIFY_BACKOFF_DELAYS, 1):
+            time.sleep(delay)
+            self._verify_pending(pending, verified, last_values)
+            if not pending:
+                break
             
-            if retry < 2:
-                print(f"  ⏳ 재시도 중... ({retry + 1}/3)")
-                time.sleep(0.5)
+            if attempt < attempts:
+                print(f"  ⏳ 재시도 중... ({attempt}/{attempts - 1}, 미확인 {len(pending)}개)")
         
-        print_warning(f"확인된 값: {verify_val:.2f} (변경이 반영되지 않음)")
-        print("  → INCA GUI에서 수동으로 'Download to ECU'를 클릭하세요")
-        return False
+        for var_name in pending:
+            verify_val = last_values.get(var_name)
+            shown = f"{verify_val:.2f}" if verify_val is not None else "N/A"
+            print_warning(f"{var_name} 확인된 값: {shown} (변경이 반영되지 않음)")
+        
+        if pending:
+            print("  → INCA GUI에서 수동으로 'Download to ECU'를 클릭하세요")
+        return verified
     
-    def _read_calibration(self, var_name: str) -> Optional[float]:
-        """캘리브레이션 값을 읽습니다."""
-        try:
+    def _verify_pending(self, pending: Dict[str, float], verified: Set[str],
+                        last_values: Dict[str, Optional[float]]) -> None:
+        """
+        미확인 변수들을 한 번씩 읽어 검증합니다.
+        
+        @param pending: 미확인 {변수명: 예상 값} 딕셔너리 (확인된 항목은 제거됨)
+        @param verified: 확인된 변수를 추가할 집합
+        @param last_values: 변수별 마지막으로 읽은 값을 기록할 딕셔너리
+        """
+        read_cache = {var_name: self._read_calibration(var_name) for var_name in pending}
+        last_values.update(read_cache)
+        
+        for var_name in self._find_matches(pending, read_cache):
+            print(f"  ✓ {var_name} 확인 완료: {read_cache[var_name]:.2f} (변경 성공!)")
+            verified.add(var_name)
+            del pending[var_name]
+    
+    @staticmethod
+    def _find_matches(expected: Dict[str, float],
+                      actual: Dict[str, Optional[float]]) -> List[str]:
+        """
+        읽은 값이 예상 값과 허용 오차 이내인 변수를 찾습니다.
+        
+        @param expected: {변수명: 예상 값} 딕셔너리
+        @param actual: {변수명: 읽은 값 또는 None} 딕셔너리
+        @return: 일치하는 변수명 리스트
+        """
+        tolerance = CalibrationApplicator.VERIFY_TOLERANCE
+        return [
+            var_name for var_name, expected_value in expected.items()
+            if actual.get(var_name) is not None
+            and abs(actual[var_name] - expected_value) < tolerance
+        ]
+    
+    def _get_calib_obj(self, var_name: str) -> Any:
+        """
+        캘리브레이션 COM 객체를 가져옵니다 (변수별로 한 번만 조회 후 캐시).
+        
+        @param var_name: 변수명
+        @return: 캘리브레이션 값 COM 객체
+        @raises: Exception if COM lookup fails
+        """
+        calib_obj = self._calib_obj_cache.get(var_name)
+        if calib_obj is None:
             calib_obj = self.controller.experiment.GetCalibrationValueInDevice(
                 var_name, self.controller.device
             )
-            return calib_obj.GetDoublePhysValue()
-        except Exception:
-            return None
+            self._calib_obj_cache[var_name] = calib_obj
+        return calib_obj
     
-    def _write_calibration(self, var_name: str, value: float) -> bool:
-        """캘리브레이션 값을 씁니다."""
+    def _read_calibration(self, var_name: str) -> Optional[float]:
+        """캘리브레이션 값을 읽습니다."""
         try:
-            calib_obj = self.controller.experiment.GetCalibrationValueInDevice(
-                var_name, self.controller.device
-            )
-            calib_obj.SetDoublePhysValue(value)
-            time.sleep(0.1)
-            self._sync_memory()
-            return True
-        except Exception as e:
-            print(f"  ✗ {var_name} 쓰기 실패: {e}")
-            return False
+            return self._get_calib_obj(var_name).GetDoublePhysValue()
+        except Exception:
+            return None
     
     def _sync_memory(self) -> bool:
-        """메모리 페이지를 동기화합니다."""
+        """
+        메모리 페이지를 동기화합니다.
+        
+        처음 성공한 동기화 메서드를 기억해 두고 이후에는 바로 호출합니다.
+        기억한 메서드가 실패하면 다시 탐색합니다.
+        
+        @return: 성공 여부
+        """
         print("\n  메모리 페이지 동기화 시도 중...")
         
+        if self._sync_fn is not None:
+            try:
+                self._sync_fn()
+                print(f"  ✓ {self._sync_name} 완료")
+                return True
+            except:
+                self._sync_fn = None
+        
         sync_methods = [
             ("Synchronize", lambda: self.controller.experiment.Synchronize()),
             ("DownloadWorkingPage", lambda: self.controller.experiment.DownloadWorkingPage()),
@@ -716,6 +1312,8 @@ class CalibrationApplicator:
             try:
                 method()
                 print(f"  ✓ {method_name} 완료")
+                self._sync_fn = method
+                self._sync_name = method_name
                 return True
             except:
                 continue
@@ -742,52 +1340,270 @@ class CalibrationApplicator:
 # 측정 데이터 수집기
 # ============================================================================
 
+class CsvBackgroundWriter:
+    """CSV 행 배치를 별도 스레드에서 기록하는 클래스"""
+    
+    def __init__(self, csv_file, batch_size: int, row_width: int,
+                 max_batches: int = 16, expected_rows: int = 0):
+        """
+        기록 스레드를 시작합니다.
+        
+        @param csv_file: 헤더가 기록된 CSV 파일 객체 (newline='' 로 열린 파일)
+        @param batch_size: 배치당 행 수
+        @param row_width: 행당 열 수
+        @param max_batches: 대기열에 쌓을 수 있는 최대 배치 수 (초과 시 샘플링 대기)
+        @param expected_rows: 예상 행 수 (측정 중 배치를 새로 만들지 않도록 미리 할당)
+        """
+        self._csv_file = csv_file
+        # 헤더(텍스트 계층)를 먼저 내보낸 뒤부터는 바이너리 버퍼에만 기록
+        csv_file.flush()
+        self._write_batch = self._make_writer(csv_file.buffer, row_width)
+        self._batch_size = batch_size
+        self._row_width = row_width
+        self._pending = queue.Queue(maxsize=max_batches)
+        self._free = queue.Queue()
+        self._error: Optional[Exception] = None
+        
+        # 동시에 쓰이는 배치는 대기열 max_batches개 + 채우는 중 1개 + 기록 중 1개를 넘지 않음
+        for _ in range(min(math.ceil(expected_rows / batch_size), max_batches + 2)):
+            self._free.put(self._new_batch())
+        
+        self._thread = threading.Thread(target=self._run, name="csv-writer", daemon=True)
+        self._thread.start()
+    
+    def acquire_batch(self) -> List[List]:
+        """
+        채울 배치를 가져옵니다 (기록이 끝난 배치가 있으면 재사용).
+        
+        @return: batch_size개의 행 리스트
+        """
+        try:
+            return self._free.get_nowait()
+        except queue.Empty:
+            return self._new_batch()
+    
+    def _new_batch(self) -> List[List]:
+        """빈 행 batch_size개로 이루어진 배치를 만듭니다."""
+        return [[None] * self._row_width for _ in range(self._batch_size)]
+    
+    @staticmethod
+    def _make_writer(raw_file, row_width: int) -> Callable[[List[List], int], None]:
+        """
+        열 개수에 맞춘 배치 기록 함수를 생성합니다.
+        
+        측정 중에는 열 개수가 바뀌지 않으므로 행 서식 문자열과 기록 대상을
+        클로저에 한 번 묶어 두고, 배치마다 속성 조회나 서식 생성을 하지 않습니다.
+        
+        @param raw_file: 기록할 바이너리 파일 객체
+        @param row_width: 행당 열 수
+        @return: write_batch(batch, count) 함수 - 배치의 앞 count개 행을 기록
+        """
+        # 데이터 행은 숫자와 고정 문자열뿐이라 따옴표 처리가 필요 없음
+        # csv.writer 기본값과 같은 출력 (구분자 ',', 줄바꿈 '\r\n', float는 repr)
+        format_row = (",".join(["{}"] * row_width) + "\r\n").format
+        join = "".join
+        write = raw_file.write
+        
+        def write_batch(batch: List[List], count: int) -> None:
+            write(join([format_row(*row) for row in batch[:count]]).encode('ascii'))
+        
+        return write_batch
+    
+    def submit(self, batch: List[List], count: int) -> None:
+        """
+        배치의 앞 count개 행을 기록 대기열에 넣습니다.
+        
+        @param batch: acquire_batch로 받은 배치 (이후 호출자는 사용하지 않음)
+        @param count: 기록할 행 수
+        """
+        if count:
+            self._pending.put((batch, count))
+    
+    def close(self) -> None:
+        """
+        남은 배치를 모두 기록하고 스레드를 종료합니다.
+        
+        @raises: 기록 중 발생한 첫 번째 예외
+        """
+        self._pending.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+    
+    def _run(self) -> None:
+        """대기열의 배치를 기록합니다 (기록 스레드)."""
+        write_batch = self._write_batch
+        flush = self._csv_file.flush
+        
+        while True:
+            item = self._pending.get()
+            if item is None:
+                return
+            
+            batch, count = item
+            if self._error is None:
+                try:
+                    write_batch(batch, count)
+                    flush()
+                except Exception as e:
+                    self._error = e
+            self._free.put(batch)
+
+
+class ConsoleLinePrinter:
+    """화면 출력 줄을 별도 스레드에서 모아서 출력하는 클래스"""
+    
+    def __init__(self, max_lines: int = 1024, period: float = 0.05):
+        """
+        출력 스레드를 시작합니다.
+        
+        @param max_lines: 링 버퍼에 보관할 최대 줄 수
+        @param period: 버퍼를 비우는 주기 (초)
+        """
+        # 가득 차면 가장 오래된 줄부터 버림 (CSV에는 모든 샘플이 기록됨)
+        self._lines = collections.deque(maxlen=max_lines)
+        self._period = period
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="console-printer", daemon=True)
+        self._thread.start()
+        # deque.append는 잠금 없이 스레드 간에 안전하게 호출 가능
+        self.put = self._lines.append
+    
+    def close(self) -> None:
+        """남은 줄을 모두 출력하고 스레드를 종료합니다."""
+        self._stop.set()
+        self._thread.join()
+        self._drain()
+    
+    def _run(self) -> None:
+        """주기적으로 버퍼를 비웁니다 (출력 스레드)."""
+        while not self._stop.wait(self._period):
+            self._drain()
+    
+    def _drain(self) -> None:
+        """버퍼에 쌓인 줄을 한 번에 출력합니다."""
+        lines = self._lines
+        chunk = []
+        while lines:
+            chunk.append(lines.popleft())
+        if chunk:
+            sys.stdout.write("\n".join(chunk) + "\n")
+            sys.stdout.flush()
+
+
 class MeasurementCollector:
     """측정 데이터 수집을 담당하는 클래스"""
     
-    def __init__(self, controller: INCADemoController):
+    # CSV 행을 모아서 기록할 샘플 개수 (배치마다 한 번 파일로 내보냄)
+    CSV_BATCH_SIZE = 64
+    
+    # CSV 파일 쓰기 버퍼 크기 (바이트)
+    CSV_BUFFER_SIZE = 1 << 20
+    
+    # 측정 중에 기록하는 임시 파일 접미사 (종료 시 최종 파일명으로 교체)
+    CSV_PART_SUFFIX = ".part"
+    
+    # 연결 확인 시 동시에 읽을 최대 스레드 수
+    PROBE_MAX_WORKERS = 8
+    
+    # _build_sampler가 변수마다 펼쳐 넣는 코드 조각
+    # (NaN은 자기 자신과 같지 않으므로 v == v가 곧 읽기 성공 여부)
+    _SAMPLER_READ_TEMPLATE = (
+        "        try:\n"
+        "            v = float(g{idx}())\n"
+        "        except Exception:\n"
+        "            v = nan\n"
+        "        ok = v == v\n"
+        "        row[{col}] = v if ok else 'N/A'\n"
+        "        display[{idx}] = format_value(v) if ok else display_na\n"
+    )
+    _SAMPLER_MISSING_TEMPLATE = (
+        "        row[{col}] = 'N/A'\n"
+        "        display[{idx}] = display_na\n"
+    )
+    
+    # 화면 출력용 서식 (샘플마다 f-string을 다시 만들지 않도록 미리 준비)
+    DISPLAY_NA = f"{'N/A':>15}"
+    _format_display_value = "{:>15.2f}".format
+    
+    def __init__(self, controller: INCADemoController, parallel_probe: bool = True):
         """
         초기화합니다.
         
         @param controller: INCA 컨트롤러 인스턴스
+        @param parallel_probe: 연결 확인을 여러 스레드로 동시에 수행할지 여부
         """
         self.controller = controller
+        self.parallel_probe = parallel_probe
+        self._measure_obj_cache: Dict[str, Any] = {}
+        self._base_epoch = 0.0
+        self._base_mono = 0.0
+        self._last_second = None
+        self._last_second_str = ""
     
-    def collect_and_save(self, duration: float, interval: float, csv_filename: str) -> None:
+    def collect_and_save(self, duration: float, interval: float,
+                         csv_filename: str) -> Optional[str]:
         """
         측정 데이터를 수집하고 CSV에 저장합니다.
         
+        출력 파일은 CSV 파일을 열기 직전에 선점하고, 샘플링 시작 전에 실패하면
+        선점한 파일을 지우므로 빈 파일이 남지 않습니다. 이미 있는 파일명이면
+        _1, _2 등을 붙인 이름을 사용합니다.
+        
         @param duration: 측정 시간 (초)
         @param interval: 샘플링 간격 (초)
         @param csv_filename: 저장할 CSV 파일명
+        @return: 실제로 저장한 CSV 파일명 또는 None (출력 파일을 만들 수 없는 경우)
         """
         print_section_header("실시간 측정 및 CSV 저장")
         
         num_samples = int(duration / interval)
         self._print_settings(duration, interval, num_samples, csv_filename)
         
-        var_names_list = list(self.controller.measurement_vars.values())
+        var_names_list = self.controller.measurement_vars
         connection_ok = self._check_connections(var_names_list)
+        # COM 객체 조회는 파일 선점 전에 끝내 둠 (중단되어도 빈 파일이 남지 않도록)
+        sample = self._build_sampler(self._prefetch_measure_objs(var_names_list), offset=2)
         
-        csv_file = self._open_csv_file(csv_filename, var_names_list)
+        csv_filename = FileValidator.get_available_filename(csv_filename, self.CSV_PART_SUFFIX)
+        if not csv_filename:
+            return None
         
+        # 측정 중에는 임시 파일에 기록하고 끝난 뒤 한 번에 교체하므로
+        # 최종 파일명에는 줄 단위로 온전한 결과만 나타남
+        part_filename = csv_filename + self.CSV_PART_SUFFIX
         try:
-            self._collect_samples(csv_file, var_names_list, num_samples, interval)
+            csv_file = self._open_csv_file(part_filename, var_names_list)
+        except BaseException:
+            FileValidator.release_output_file(csv_filename, self.CSV_PART_SUFFIX)
+            raise
+        
+        try:
+            self._collect_samples(csv_file, sample, var_names_list, num_samples, interval)
         finally:
-            csv_file.close()
+            try:
+                csv_file.flush()
+                os.fsync(csv_file.fileno())
+            finally:
+                csv_file.close()
+            os.replace(part_filename, csv_filename)
         
         print(f"\n✓ 측정 완료")
         print(f"✓ 결과가 CSV 파일에 저장되었습니다: {csv_filename}")
+        return csv_filename
     
     def _print_settings(self, duration: float, interval: float, 
                        num_samples: int, csv_filename: str) -> None:
         """측정 설정을 출력합니다."""
-        print("측정 설정:")
-        print(f"  - 측정 시간: {duration}초")
-        print(f"  - 샘플링 간격: {interval}초")
-        print(f"  - 예상 샘플 수: {num_samples}개")
-        print(f"  - 출력 파일: {csv_filename}")
-        print(f"  - 시작 시각: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        lines = [
+            "측정 설정:",
+            f"  - 측정 시간: {duration}초",
+            f"  - 샘플링 간격: {interval}초",
+            f"  - 예상 샘플 수: {num_samples}개",
+            f"  - 출력 파일: {csv_filename}",
+            f"  - 시작 시각: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def _check_connections(self, var_names_list: List[str]) -> int:
         """
@@ -800,15 +1616,113 @@ class MeasurementCollector:
         print(f"  장치: {self.controller.device_name}")
         print(f"  변수 개수: {len(var_names_list)}개")
         
-        connection_ok = 0
-        for var_name in var_names_list:
-            value = self._read_measurement(var_name, verbose=True)
-            if value is not None:
-                connection_ok += 1
+        results = None
+        if self.parallel_probe and len(var_names_list) > 1:
+            results = self._probe_parallel(var_names_list)
+        
+        if results is None:
+            connection_ok = 0
+            for var_name in var_names_list:
+                if self._read_measurement(var_name, verbose=True) is not None:
+                    connection_ok += 1
+        else:
+            for var_name, (value, error) in zip(var_names_list, results):
+                self._print_probe_result(var_name, value, error)
+            connection_ok = sum(1 for _, error in results if error is None)
         
         self._print_connection_status(connection_ok, len(var_names_list))
         return connection_ok
     
+    def _probe_parallel(self, var_names_list: List[str]) -> Optional[List[Tuple]]:
+        """
+        여러 스레드에서 측정값을 동시에 읽어 연결을 확인합니다.
+        
+        COM 객체는 스레드 간에 직접 공유할 수 없으므로 변수마다
+        Experiment/장치 인터페이스를 마샬링하여 작업 스레드에 넘깁니다.
+        
+        @param var_names_list: 측정 변수 리스트
+        @return: 변수 순서대로의 (값, 오류) 튜플 리스트 또는 None (병렬 실행 불가 시)
+        """
+        try:
+            import pythoncom
+            experiment = self.controller.experiment._oleobj_
+            device = self.controller.device._oleobj_
+            streams = [
+                (pythoncom.CoMarshalInterThreadInterfaceInStream(pythoncom.IID_IDispatch, experiment),
+                 pythoncom.CoMarshalInterThreadInterfaceInStream(pythoncom.IID_IDispatch, device))
+                for _ in var_names_list
+            ]
+        except Exception:
+            return None
+        
+        from concurrent.futures import ThreadPoolExecutor
+        workers = min(self.PROBE_MAX_WORKERS, len(var_names_list))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self._probe_in_thread, var_names_list, streams))
+    
+    @staticmethod
+    def _probe_in_thread(var_name: str, streams: Tuple) -> Tuple[Optional[float], Optional[str]]:
+        """
+        작업 스레드에서 측정값 하나를 읽습니다.
+        
+        @param var_name: 측정 변수명
+        @param streams: 마샬링된 (Experiment, 장치) 인터페이스 스트림
+        @return: (값, 오류 메시지) 튜플 (성공 시 오류는 None)
+        """
+        import pythoncom
+        pythoncom.CoInitialize()
+        try:
+            return MeasurementCollector._probe_read(var_name, streams)
+        finally:
+            pythoncom.CoUninitialize()
+    
+    @staticmethod
+    def _probe_read(var_name: str, streams: Tuple) -> Tuple[Optional[float], Optional[str]]:
+        """
+        마샬링된 인터페이스로 측정값 하나를 읽습니다 (COM이 초기화된 스레드에서 호출).
+        
+        COM 프록시는 모두 이 함수의 지역 변수라 반환과 함께 (CoUninitialize 전에,
+        같은 스레드에서) 해제됩니다. 오류는 문자열로 반환하여 traceback이 프록시를
+        붙잡은 채 다른 스레드로 넘어가지 않도록 합니다.
+        
+        @param var_name: 측정 변수명
+        @param streams: 마샬링된 (Experiment, 장치) 인터페이스 스트림
+        @return: (값, 오류 메시지) 튜플 (성공 시 오류는 None)
+        """
+        import pythoncom
+        import win32com.client
+        experiment_stream, device_stream = streams
+        
+        try:
+            experiment = win32com.client.Dispatch(
+                pythoncom.CoGetInterfaceAndReleaseStream(experiment_stream, pythoncom.IID_IDispatch)
+            )
+        except Exception as e:
+            # 장치 스트림도 꺼내서 바로 버려 마샬링된 참조가 남지 않도록 함
+            try:
+                pythoncom.CoGetInterfaceAndReleaseStream(device_stream, pythoncom.IID_IDispatch)
+            except Exception:
+                pass
+            return None, str(e)
+        
+        try:
+            device = win32com.client.Dispatch(
+                pythoncom.CoGetInterfaceAndReleaseStream(device_stream, pythoncom.IID_IDispatch)
+            )
+            measure_obj = experiment.GetMeasurementValueInDevice(var_name, device)
+            return measure_obj.GetDoublePhysValue(), None
+        except Exception as e:
+            return None, str(e)
+    
+    @staticmethod
+    def _print_probe_result(var_name: str, value: Optional[float],
+                            error: Optional[str]) -> None:
+        """연결 확인 결과 한 건을 출력합니다."""
+        if error is None:
+            print(f"  디버그: {var_name} = {value}")
+        else:
+            print(f"  경고: {var_name} 읽기 실패 - {error}")
+    
     def _print_connection_status(self, ok_count: int, total_count: int) -> None:
         """연결 상태를 출력합니다."""
         if ok_count == 0:
@@ -827,73 +1741,211 @@ class MeasurementCollector:
         """CSV 파일을 엽니다."""
         print("\nCSV 파일 생성 중...")
         try:
-            csv_file = open(csv_filename, 'w', newline='', encoding='utf-8-sig')
+            csv_file = open(csv_filename, 'w', newline='', encoding='utf-8-sig',
+                            buffering=self.CSV_BUFFER_SIZE)
             print_success("CSV 파일 생성 성공")
             
-            # 헤더 작성
+            # 헤더 작성 (실패 시 파일을 닫아 호출자가 지울 수 있도록 함)
             header = ['시간(초)', '타임스탬프'] + var_names_list
-            csv_writer = csv.writer(csv_file)
-            csv_writer.writerow(header)
+            try:
+                csv.writer(csv_file).writerow(header)
+            except BaseException:
+                csv_file.close()
+                raise
             
             return csv_file
         except Exception as e:
             print_error(f"CSV 파일을 생성할 수 없습니다!", [f"오류 내용: {e}"])
             raise
     
-    def _collect_samples(self, csv_file, var_names_list: List[str], 
-                        num_samples: int, interval: float) -> None:
-        """샘플을 수집합니다."""
+    def _collect_samples(self, csv_file, sample: Callable[[List, List[str]], None],
+                         var_names_list: List[str], num_samples: int, interval: float) -> None:
+        """
+        샘플을 수집합니다.
+        
+        @param csv_file: 헤더가 기록된 CSV 파일 객체
+        @param sample: _build_sampler로 만든 샘플 읽기 함수 (행의 2번째 열부터 채움)
+        @param var_names_list: 측정 변수 리스트
+        @param num_samples: 수집할 샘플 수
+        @param interval: 샘플링 간격 (초)
+        """
         print_section_header("측정 시작")
         
         # 헤더 출력
-        header_line = f"{'시간(초)':>8} "
-        header_line += ' '.join([f"{v:>15}" for v in var_names_list])
-        print(header_line)
+        print(f"{'시간(초)':>8} " + ' '.join(f"{v:>15}" for v in var_names_list))
         print("-" * 80)
         
-        csv_writer = csv.writer(csv_file)
+        # 화면 한 줄을 한 번의 format 호출로 만들기 위한 템플릿 (변수 개수 고정)
+        format_line = ("{:>7.1f}s " + " ".join(["{}"] * len(var_names_list))).format
+        
+        # CSV 행 배치는 기록 스레드가 돌려주면 재사용하고, 화면 버퍼는 하나를 계속 사용
+        writer = CsvBackgroundWriter(csv_file, self.CSV_BATCH_SIZE, len(var_names_list) + 2,
+                                     expected_rows=num_samples)
+        batch = writer.acquire_batch()
+        display_buf = [''] * len(var_names_list)
+        pending = 0
+        printer = ConsoleLinePrinter()
+        
+        # 루프 안에서 쓰는 메서드/속성은 지역 변수로 미리 바인딩
+        # (샘플마다 self./writer. 속성 조회를 반복하지 않도록 - 루프 수정 시 유지할 것)
+        current_timestamp = self._current_timestamp
+        wait_for_next_slot = self._wait_for_next_slot
+        submit = writer.submit
+        acquire_batch = writer.acquire_batch
+        put_line = printer.put
+        batch_size = self.CSV_BATCH_SIZE
+        
+        self._start_timestamp_clock()
+        start = time.monotonic()
+        slot = 0
         
-        for i in range(num_samples):
-            elapsed_time = (i + 1) * interval
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
-            
-            values, display_values = self._read_all_measurements(var_names_list)
-            
-            # CSV 기록
-            row = [f"{elapsed_time:.1f}", timestamp] + values
-            csv_writer.writerow(row)
-            
-            # 화면 출력
-            display_line = f"{elapsed_time:>7.1f}s "
-            display_line += ' '.join(display_values)
-            print(display_line)
-            
-            time.sleep(interval)
+        try:
+            while slot < num_samples:
+                elapsed_time = (slot + 1) * interval
+                row = batch[pending]
+                row[0] = f"{elapsed_time:.1f}"
+                row[1] = current_timestamp()
+                
+                sample(row, display_buf)
+                
+                # CSV 기록 (CSV_BATCH_SIZE개씩 모아서 기록 스레드로 전달)
+                pending += 1
+                if pending == batch_size:
+                    submit(batch, pending)
+                    batch = acquire_batch()
+                    pending = 0
+                
+                # 화면 출력 (출력 스레드가 모아서 내보냄)
+                put_line(format_line(elapsed_time, *display_buf))
+                
+                slot = wait_for_next_slot(start, slot, interval, put_line)
+        finally:
+            printer.close()
+            writer.submit(batch, pending)
+            writer.close()
         
         print("-" * 80)
         print(f"종료 시각: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
-    def _read_all_measurements(self, var_names_list: List[str]) -> Tuple[List, List[str]]:
+    def _start_timestamp_clock(self) -> None:
+        """타임스탬프 계산의 기준 시각(벽시계/monotonic)을 기록합니다."""
+        self._base_epoch = time.time()
+        self._base_mono = time.monotonic()
+        self._last_second = None
+    
+    def _current_timestamp(self) -> str:
         """
-        모든 측정값을 읽습니다.
+        현재 타임스탬프 문자열을 만듭니다 (밀리초 단위).
         
-        @param var_names_list: 측정 변수 리스트
-        @return: (CSV용 값 리스트, 화면 표시용 문자열 리스트) 튜플
+        strftime은 초가 바뀔 때만 호출하고, 그 사이에는 캐시된 문자열에
+        밀리초만 붙입니다.
+        
+        @return: 'YYYY-MM-DD HH:MM:SS.mmm' 형식의 문자열
+        """
+        now = self._base_epoch + (time.monotonic() - self._base_mono)
+        second = int(now)
+        
+        if second != self._last_second:
+            self._last_second = second
+            self._last_second_str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(second))
+        
+        return f"{self._last_second_str}.{int((now - second) * 1000):03d}"
+    
+    def _wait_for_next_slot(self, start: float, slot: int, interval: float,
+                            put_line: Callable[[str], None]) -> int:
+        """
+        다음 샘플 시각까지 대기합니다.
+        
+        샘플 시각은 start + slot * interval로 고정되어 있어 읽기에 걸린 시간이
+        누적되지 않습니다. 한 주기 이상 밀린 경우 놓친 주기를 건너뛰므로
+        전체 측정 시간은 항상 요청한 시간(num_samples * interval)을 따릅니다.
+        
+        @param start: 측정 시작 시각 (time.monotonic 기준)
+        @param slot: 방금 수집한 샘플의 순번
+        @param interval: 샘플링 간격 (초)
+        @param put_line: 화면 출력 함수 (샘플 줄과 같은 순서로 경고를 출력하기 위함)
+        @return: 다음에 수집할 샘플의 순번
+        """
+        next_slot = slot + 1
+        lag = time.monotonic() - (start + next_slot * interval)
+        
+        if lag < 0:
+            time.sleep(-lag)
+        elif lag > interval:
+            skipped = int(lag // interval)
+            put_line(f"⚠ 샘플링이 {lag:.2f}초 지연되어 {skipped}개 주기를 건너뜁니다")
+            next_slot += skipped
+        return next_slot
+    
+    def _prefetch_measure_objs(self, var_names_list: List[str]) -> List[Any]:
         """
-        values = []
-        display_values = []
+        샘플링 전에 측정 COM 객체를 한 번에 조회합니다.
         
+        @param var_names_list: 측정 변수 리스트
+        @return: 변수 순서대로의 COM 객체 리스트 (조회 실패 시 None)
+        """
+        measure_objs = []
         for var_name in var_names_list:
-            value = self._read_measurement(var_name, verbose=False)
-            
-            if value is not None:
-                values.append(value)
-                display_values.append(f"{value:>15.2f}")
+            try:
+                measure_objs.append(self._get_measure_obj(var_name))
+            except Exception:
+                measure_objs.append(None)
+        return measure_objs
+    
+    def _build_sampler(self, measure_objs: List[Any],
+                       offset: int = 0) -> Callable[[List, List[str]], None]:
+        """
+        변수 개수에 맞춰 펼쳐진(unrolled) 샘플 읽기 함수를 생성합니다.
+        
+        측정 중에는 변수 목록이 바뀌지 않으므로, 변수마다의 읽기/기록 코드를
+        직선형 코드로 한 번 생성해 두어 샘플마다 반복문과 인덱스 계산,
+        메서드 조회를 하지 않도록 합니다. 조회에 실패한 변수는 항상 'N/A'를
+        기록하는 코드로 대체됩니다.
+        
+        @param measure_objs: 미리 조회한 측정 COM 객체 리스트 (실패 시 None)
+        @param offset: 행 버퍼에서 첫 측정값이 들어갈 위치
+        @return: sample(row, display) 함수 - row[offset:]와 display를 채움
+        """
+        getters = {}
+        body = []
+        
+        for idx, measure_obj in enumerate(measure_objs):
+            getter = getattr(measure_obj, "GetDoublePhysValue", None)
+            if getter is None:
+                body.append(self._SAMPLER_MISSING_TEMPLATE.format(idx=idx, col=offset + idx))
             else:
-                values.append('N/A')
-                display_values.append(f"{'N/A':>15}")
+                getters[f"g{idx}"] = getter
+                body.append(self._SAMPLER_READ_TEMPLATE.format(idx=idx, col=offset + idx))
+        
+        params = "".join(f"{name}, " for name in getters)
+        body_source = "".join(body) or "        pass\n"
+        source = (
+            f"def _make_sampler({params}nan, format_value, display_na):\n"
+            f"    def _sample(row, display):\n"
+            f"{body_source}"
+            f"    return _sample\n"
+        )
+        namespace = {}
+        exec(compile(source, "<measurement-sampler>", "exec"), namespace)
+        return namespace["_make_sampler"](
+            *getters.values(), NAN, self._format_display_value, self.DISPLAY_NA
+        )
+    
+    def _get_measure_obj(self, var_name: str) -> Any:
+        """
+        측정 COM 객체를 가져옵니다 (변수별로 한 번만 조회 후 캐시).
         
-        return values, display_values
+        @param var_name: 측정 변수명
+        @return: 측정 값 COM 객체
+        @raises: Exception if COM lookup fails
+        """
+        measure_obj = self._measure_obj_cache.get(var_name)
+        if measure_obj is None:
+            measure_obj = self.controller.experiment.GetMeasurementValueInDevice(
+                var_name, self.controller.device
+            )
+            self._measure_obj_cache[var_name] = measure_obj
+        return measure_obj
     
     def _read_measurement(self, var_name: str, verbose: bool = False) -> Optional[float]:
         """
@@ -904,18 +1956,15 @@ class MeasurementCollector:
         @return: 측정값 또는 None
         """
         try:
-            measure_obj = self.controller.experiment.GetMeasurementValueInDevice(
-                var_name, self.controller.device
-            )
-            value = measure_obj.GetDoublePhysValue()
+            value = self._get_measure_obj(var_name).GetDoublePhysValue()
             
             if verbose:
-                print(f"  디버그: {var_name} = {value}")
+                self._print_probe_result(var_name, value, None)
             
             return value
         except Exception as e:
             if verbose:
-                print(f"  경고: {var_name} 읽기 실패 - {e}")
+                self._print_probe_result(var_name, None, e)
             return None
 
 
@@ -923,11 +1972,12 @@ class MeasurementCollector:
 # 명령줄 인자 파서
 # ============================================================================
 
-def parse_arguments() -> argparse.Namespace:
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
     """
-    명령줄 인자를 파싱합니다.
+    명령줄 인자 파서를 생성합니다 (최초 호출 시 한 번만 생성).
     
-    @return: 파싱된 인자 객체
+    @return: 인자 파서
     """
     parser = argparse.ArgumentParser(
         description='INCA 자동화 스크립트 - Excel 기반 캘리브레이션 및 측정',
@@ -958,9 +2008,20 @@ Excel 파일 형식 (첫 행은 헤더):
                         help='결과를 저장할 CSV 파일명')
     parser.add_argument('-p', '--project', default='Demo3', metavar='NAME',
                         help='INCA 프로젝트 이름 (기본값: Demo3)')
+    parser.add_argument('--verbose', action='store_true',
+                        help='Excel에서 읽은 캘리브레이션 변수를 모두 출력')
     parser.add_argument('-v', '--version', action='version', version='%(prog)s 2.0')
     
-    return parser.parse_args()
+    return parser
+
+
+def parse_arguments() -> argparse.Namespace:
+    """
+    명령줄 인자를 파싱합니다.
+    
+    @return: 파싱된 인자 객체
+    """
+    return _build_parser().parse_args()
 
 
 # ============================================================================
@@ -973,40 +2034,62 @@ def print_script_header(args: argparse.Namespace) -> None:
     
     @param args: 명령줄 인자
     """
-    print("=" * 80)
-    print("INCA DEMO 프로젝트 자동 제어 스크립트 (리팩토링 버전)")
-    print("=" * 80)
-    print("\n[실행 설정]")
-    print(f"  프로젝트 이름: {args.project}")
-    print(f"  캘리브레이션 파일: {args.calib}")
-    print(f"  측정 변수: {args.measure}")
-    print(f"  측정 시간: {args.duration}초")
-    print(f"  샘플링 간격: {args.interval}초")
-    print(f"  예상 샘플 수: {int(args.duration / args.interval)}개")
-    print(f"  출력 CSV 파일: {args.output}")
-    print(f"  실행 시각: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    lines = [
+        "=" * 80,
+        "INCA DEMO 프로젝트 자동 제어 스크립트 (리팩토링 버전)",
+        "=" * 80,
+        "\n[실행 설정]",
+        f"  프로젝트 이름: {args.project}",
+        f"  캘리브레이션 파일: {args.calib}",
+        f"  측정 변수: {args.measure}",
+        f"  측정 시간: {args.duration}초",
+        f"  샘플링 간격: {args.interval}초",
+        f"  예상 샘플 수: {int(args.duration / args.interval)}개",
+        f"  출력 CSV 파일: {args.output}",
+        f"  실행 시각: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-def wait_for_stabilization() -> None:
-    """데이터 안정화를 위해 대기합니다."""
+def wait_for_stabilization(seconds: float = 3.0) -> None:
+    """
+    데이터 안정화를 위해 대기합니다.
+    
+    하나의 monotonic 마감 시각을 기준으로 대기하므로 출력에 걸린 시간이
+    대기 시간에 더해지지 않습니다.
+    
+    @param seconds: 대기 시간 (초)
+    """
     print("\n데이터 안정화 대기 중...")
-    for i in range(3, 0, -1):
-        print(f"  {i}초...")
-        time.sleep(1)
+    deadline = time.monotonic() + seconds
+    remaining = seconds
+    
+    while remaining > 0:
+        print(f"  {math.ceil(remaining)}초...")
+        time.sleep(min(remaining, 1.0))
+        remaining = deadline - time.monotonic()
+    
     print_success("준비 완료")
 
 
-def print_completion_summary(output_filename: str) -> None:
+def print_completion_summary(output_filename: Optional[str]) -> None:
     """
     완료 요약을 출력합니다.
     
-    @param output_filename: 출력 파일명
+    @param output_filename: 출력 파일명 (None이면 출력 파일을 만들지 못해 종료된 것으로 표시)
     """
+    if not output_filename:
+        print_section_header("✗ 스크립트 종료: 출력 파일 생성 불가")
+        return
+    
     print_section_header("✓ 모든 작업 완료!")
-    print("\n[결과 정보]")
-    print(f"  출력 파일: {output_filename}")
-    print(f"  완료 시각: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("\n스크립트 실행이 성공적으로 완료되었습니다.")
+    lines = [
+        "\n[결과 정보]",
+        f"  출력 파일: {output_filename}",
+        f"  완료 시각: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "\n스크립트 실행이 성공적으로 완료되었습니다.",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -1020,7 +2103,7 @@ def main():
     
     try:
         # 1. Excel 로드
-        calib_data = ExcelCalibrationLoader.load(args.calib)
+        calib_data = ExcelCalibrationLoader.load(args.calib, verbose=args.verbose)
         if not calib_data:
             print_section_header("✗ 스크립트 종료: Excel 파일 로드 실패")
             return
@@ -1030,9 +2113,8 @@ def main():
             print_section_header("✗ 스크립트 종료: 측정 변수 설정 실패")
             return
         
-        # 3. 출력 파일 확인
-        output_filename = FileValidator.get_available_filename(args.output)
-        if not output_filename:
+        # 3. 출력 폴더 확인 (파일은 측정 직전에 선점하므로 여기서는 만들지 않음)
+        if not FileValidator.validate_output_directory(args.output):
             print_section_header("✗ 스크립트 종료: 출력 파일 생성 불가")
             return
         
@@ -1056,7 +2138,7 @@ def main():
         
         # 8. 측정 및 저장
         collector = MeasurementCollector(controller)
-        collector.collect_and_save(args.duration, args.interval, output_filename)
+        output_filename = collector.collect_and_save(args.duration, args.interval, args.output)
         
         # 9. 측정 중지
         if measurement_started:
@@ -1074,7 +2156,6 @@ def main():
         print_section_header("✗ 예상치 못한 오류 발생!")
         print(f"오류 내용: {e}")
         print("\n상세 정보:")
-        import traceback
         traceback.print_exc()
         
         if controller.measurement_started: